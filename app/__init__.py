@@ -7,23 +7,23 @@ from datetime import datetime
 from typing import Dict
 
 import click
-from flask import Flask
+from flask import Flask, g
+from sqlalchemy import update
 
-from .database import db, init_db
+from .database import database_uri, db, init_db
+from .json_provider import OrjsonProvider
 from .models import Client
 from .routes import crm_bp
-from .remote import ensure_anydesk
 
 
 def create_app(test_config: Dict | None = None) -> Flask:
     """Create and configure the Flask application."""
 
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_mapping(
         SECRET_KEY=os.environ.get("CRM_SECRET_KEY", "dev"),
-        SQLALCHEMY_DATABASE_URI=os.environ.get(
-            "CRM_DATABASE_URL", f"sqlite:///{os.path.abspath('crm.sqlite')}"
-        ),
+        SQLALCHEMY_DATABASE_URI=database_uri(),
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
     )
 
@@ -33,6 +33,11 @@ def create_app(test_config: Dict | None = None) -> Flask:
     init_db(app)
     app.register_blueprint(crm_bp)
 
+    @app.teardown_request
+    def clear_serialization_cache(exc: BaseException | None) -> None:
+        g.pop("_company_cache", None)
+        g.pop("_today", None)
+
     @app.cli.command("init-db")
     def init_db_command() -> None:
         """Create all database tables."""
@@ -40,6 +45,17 @@ def create_app(test_config: Dict | None = None) -> Flask:
         db.create_all()
         print("Database initialised")
 
+    @app.cli.command("upgrade-db")
+    def upgrade_db_command() -> None:
+        """Migrate a database created by an older release to the current schema."""
+
+        from .database import upgrade_database
+
+        changes = upgrade_database(app)
+        for change in changes:
+            print(change)
+        print("Database upgraded" if changes else "Database is up to date")
+
     @app.cli.command("seed-db")
     def seed_db_command() -> None:
         """Populate the database with sample data for quick demos."""
@@ -50,13 +66,22 @@ def create_app(test_config: Dict | None = None) -> Flask:
         print("Database seeded with demo data")
 
     @app.cli.command("sync-anydesk-id")
-    @click.argument("client_id", type=int)
-    def sync_anydesk_id(client_id: int) -> None:
-        """Ensure AnyDesk is installed locally and persist the desktop ID for a client."""
-
-        client = Client.query.get(client_id)
-        if not client:
-            click.echo(f"Клиент с id={client_id} не найден.")
+    @click.argument("client_ids", nargs=-1, type=int, required=True)
+    def sync_anydesk_id(client_ids: tuple[int, ...]) -> None:
+        """Ensure AnyDesk is installed locally and persist the desktop ID for clients."""
+
+        from .remote import ensure_anydesk
+
+        clients = (
+            Client.query.with_entities(Client.id, Client.name)
+            .filter(Client.id.in_(client_ids))
+            .all()
+        )
+        found_ids = {client.id for client in clients}
+        for client_id in client_ids:
+            if client_id not in found_ids:
+                click.echo(f"Клиент с id={client_id} не найден.")
+        if not clients:
             return
 
         status = ensure_anydesk()
@@ -65,12 +90,19 @@ def create_app(test_config: Dict | None = None) -> Flask:
             return
 
         if status.desk_id:
-            client.remote_support_tool = status.tool
-            client.remote_desktop_id = status.desk_id
-            db.session.commit()
-            click.echo(
-                f"ID рабочего стола {status.desk_id} сохранён для клиента {client.name}."
+            db.session.execute(
+                update(Client)
+                .where(Client.id.in_(found_ids))
+                .values(
+                    remote_support_tool=status.tool,
+                    remote_desktop_id=status.desk_id,
+                )
             )
+            db.session.commit()
+            for client in clients:
+                click.echo(
+                    f"ID рабочего стола {status.desk_id} сохранён для клиента {client.name}."
+                )
         else:
             click.echo(status.message)
 
@@ -0,0 +1,93 @@
+"""Short-lived in-process cache for expensive read-only endpoints."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Iterable, Tuple
+from urllib.parse import urlencode
+
+from flask import current_app, make_response, request
+
+# Expiry (monotonic seconds), body and mimetype of a cached response.
+_Entry = Tuple[float, bytes, str]
+
+
+class ResponseCache:
+    """Keep rendered JSON bodies for a few seconds, keyed by request path.
+
+    Entries live in ``app.extensions`` so every application instance has its
+    own store. Expired responses are purged on every insert and a store holds
+    at most ``max_entries`` responses, evicting the least recently used.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def cached(self, timeout: int, query_args: Iterable[str] = ()) -> Callable:
+        """Cache successful responses of the decorated view for ``timeout`` seconds.
+
+        ``query_args`` names the query parameters the view reads; only those
+        become part of the cache key, so unrelated parameters cannot create
+        extra entries.
+        """
+
+        query_args = tuple(query_args)
+
+        def decorator(view: Callable) -> Callable:
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                key = self._key(query_args)
+                entries = self._entries()
+                now = time.monotonic()
+                with self._lock:
+                    entry = entries.get(key)
+                    if entry and entry[0] > now:
+                        entries.move_to_end(key)
+                        return current_app.response_class(entry[1], mimetype=entry[2])
+
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200:
+                    with self._lock:
+                        self._store(
+                            entries,
+                            key,
+                            (now + timeout, response.get_data(), response.mimetype),
+                            now,
+                        )
+                return response
+
+            return wrapper
+
+        return decorator
+
+    def clear(self) -> None:
+        """Drop every response cached for the current app, e.g. after a write."""
+
+        with self._lock:
+            self._entries().clear()
+
+    @staticmethod
+    def _key(query_args: Tuple[str, ...]) -> str:
+        params = [(name, request.args[name]) for name in query_args if name in request.args]
+        return f"{request.path}?{urlencode(params)}" if params else request.path
+
+    @staticmethod
+    def _entries() -> OrderedDict[str, _Entry]:
+        return current_app.extensions.setdefault("response_cache", OrderedDict())
+
+    def _store(
+        self, entries: OrderedDict[str, _Entry], key: str, entry: _Entry, now: float
+    ) -> None:
+        for stale in [k for k, (expires, _, _) in entries.items() if expires <= now]:
+            del entries[stale]
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+
+response_cache = ResponseCache()
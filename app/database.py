@@ -2,23 +2,237 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sqlite3
+
+from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import MetaData, Table, bindparam, event, inspect
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateTable
 
 # A shared SQLAlchemy instance. It will be initialised with the Flask app in
 # :func:`init_db` from :mod:`app.__init__`.
 db = SQLAlchemy()
 
+# ``NOT NULL`` columns added after a release, mapped to the SQL expression used
+# to fill them while :func:`upgrade_database` copies the existing rows.
+_COLUMN_BACKFILLS = {
+    # start_time + duration_minutes; strftime drops fractional seconds, so the
+    # ".ffffff" suffix of the stored start_time is appended again.
+    ("appointments", "end_time"): (
+        "strftime('%Y-%m-%d %H:%M:%S', start_time, "
+        "'+' || duration_minutes || ' minutes') || substr(start_time, 20)"
+    ),
+}
+
+
+@event.listens_for(Engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """Turn on FK enforcement so SQLite honours ``ON DELETE CASCADE``."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def database_uri() -> str:
+    """Return the configured database URL, defaulting to ``crm.sqlite``."""
+    return os.environ.get(
+        "CRM_DATABASE_URL", f"sqlite:///{os.path.abspath('crm.sqlite')}"
+    )
+
 
 def init_db(app) -> None:
     """Initialise the SQLAlchemy instance with the provided Flask app."""
     db.init_app(app)
 
 
-def reset_database() -> None:
-    """Drop and recreate all database tables."""
-    from . import create_app  # local import to avoid circular dependency
+def _bare_app() -> Flask:
+    """Return a Flask instance bound only to SQLAlchemy."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = database_uri()
+    init_db(app)
+    return app
+
 
-    app = create_app()
+def reset_database(app: Flask | None = None) -> None:
+    """Drop and recreate all database tables.
+
+    Without an ``app`` a bare Flask instance bound only to SQLAlchemy is used,
+    skipping blueprint and CLI registration.
+    """
+    from . import models  # noqa: F401  # register tables on the metadata
+
+    if app is None:
+        app = _bare_app()
     with app.app_context():
         db.drop_all()
         db.create_all()
+
+
+def upgrade_database(app: Flask | None = None) -> list[str]:
+    """Bring a SQLite database created by an older release up to date.
+
+    SQLite cannot alter foreign keys or add ``NOT NULL`` columns, so every
+    table whose foreign keys or columns differ from the models is rebuilt the
+    way the SQLite documentation prescribes: create the new table, copy the
+    rows, drop the old table and rename the new one. Missing tables and
+    indexes are created. Everything runs in one transaction; the returned list
+    describes the changes made.
+    """
+    from . import models  # noqa: F401  # register tables on the metadata
+
+    if app is None:
+        app = _bare_app()
+    with app.app_context():
+        engine = db.engine
+        if engine.dialect.name != "sqlite":
+            raise RuntimeError(
+                "upgrade-db only supports SQLite; see README.md for the PostgreSQL DDL"
+            )
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            # Foreign keys must be off while tables are swapped, and the pragma
+            # is ignored inside a transaction, hence the manual BEGIN.
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            try:
+                conn.exec_driver_sql("BEGIN")
+                try:
+                    # Tags go first: the rebuilt table no longer accepts NULL.
+                    converted = _convert_csv_tags(conn)
+                    changes = _upgrade_schema(conn)
+                    if converted:
+                        changes.append(
+                            f"converted tags of {converted} knowledge base articles to JSON"
+                        )
+                    if conn.exec_driver_sql("PRAGMA foreign_key_check").first():
+                        raise RuntimeError(
+                            "Database contains rows referencing missing parents; "
+                            "see PRAGMA foreign_key_check"
+                        )
+                except BaseException:
+                    conn.exec_driver_sql("ROLLBACK")
+                    raise
+                conn.exec_driver_sql("COMMIT")
+            finally:
+                conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+    return changes
+
+
+def _upgrade_schema(conn: Connection) -> list[str]:
+    inspector = inspect(conn)
+    existing = set(inspector.get_table_names())
+    # A private copy of the schema, so the temporary tables can resolve their
+    # foreign keys without being added to ``db.metadata``.
+    scratch = MetaData()
+    for table in db.metadata.sorted_tables:
+        table.to_metadata(scratch)
+
+    changes = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing:
+            table.create(conn)
+            changes.append(f"created table {table.name}")
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        if _foreign_keys(table) != _reflected_foreign_keys(inspector, table.name) or any(
+            column.name not in columns for column in table.columns
+        ):
+            filled = _rebuild_table(conn, scratch, table, columns)
+            changes.append(f"rebuilt table {table.name}")
+            changes.extend(f"filled {table.name}.{name}" for name in filled)
+            continue
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        missing = [index for index in table.indexes if index.name not in indexes]
+        for index in missing:
+            # Dialect-specific indexes (``ddl_if``) are silently skipped here.
+            index.create(conn)
+        if missing:
+            created = {index["name"] for index in inspect(conn).get_indexes(table.name)}
+            changes.extend(
+                f"created index {index.name}" for index in missing if index.name in created
+            )
+    return changes
+
+
+def _foreign_keys(table: Table) -> set[tuple]:
+    return {
+        (
+            tuple(fk.column_keys),
+            fk.referred_table.name,
+            (fk.ondelete or "").upper(),
+        )
+        for fk in table.foreign_key_constraints
+    }
+
+
+def _reflected_foreign_keys(inspector, table_name: str) -> set[tuple]:
+    return {
+        (
+            tuple(fk["constrained_columns"]),
+            fk["referred_table"],
+            (fk["options"].get("ondelete") or "").upper(),
+        )
+        for fk in inspector.get_foreign_keys(table_name)
+    }
+
+
+def _rebuild_table(
+    conn: Connection, scratch: MetaData, table: Table, columns: set[str]
+) -> list[str]:
+    """Recreate ``table`` from the models, returning the columns it backfilled."""
+
+    new_name = f"_new_{table.name}"
+    conn.execute(CreateTable(table.to_metadata(scratch, name=new_name)))
+    copied = [column.name for column in table.columns if column.name in columns]
+    sources = [f'"{name}"' for name in copied]
+    filled = []
+    for column in table.columns:
+        if column.name in columns or column.nullable or column.server_default is not None:
+            continue
+        backfill = _COLUMN_BACKFILLS.get((table.name, column.name))
+        if backfill is None:
+            raise RuntimeError(f"No way to fill new column {table.name}.{column.name}")
+        copied.append(column.name)
+        sources.append(backfill)
+        filled.append(column.name)
+    column_list = ", ".join(f'"{name}"' for name in copied)
+    conn.exec_driver_sql(
+        f'INSERT INTO "{new_name}" ({column_list}) '
+        f'SELECT {", ".join(sources)} FROM "{table.name}"'
+    )
+    conn.exec_driver_sql(f'DROP TABLE "{table.name}"')
+    conn.exec_driver_sql(f'ALTER TABLE "{new_name}" RENAME TO "{table.name}"')
+    for index in table.indexes:
+        index.create(conn)
+    return filled
+
+
+def _convert_csv_tags(conn: Connection) -> int:
+    """Rewrite comma-separated or missing ``tags`` left by older releases as JSON lists."""
+
+    table = db.metadata.tables["knowledge_base_articles"]
+    if not inspect(conn).has_table(table.name):
+        return 0
+    # Read the raw text: the JSON column type would fail on the old values.
+    rows = conn.exec_driver_sql(
+        'SELECT id, tags FROM "knowledge_base_articles"'
+    ).all()
+    updates = []
+    for article_id, raw in rows:
+        try:
+            if isinstance(json.loads(raw), list):
+                continue
+        except (TypeError, ValueError):
+            pass
+        tags = [tag.strip() for tag in (raw or "").split(",") if tag.strip()]
+        updates.append({"_id": article_id, "_tags": tags})
+    if updates:
+        conn.execute(
+            table.update()
+            .where(table.c.id == bindparam("_id"))
+            .values(tags=bindparam("_tags")),
+            updates,
+        )
+    return len(updates)
@@ -0,0 +1,60 @@
+"""JSON provider that renders API responses with orjson."""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Mapping
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+def _default(obj: Any) -> Any:
+    """Serialize objects orjson does not know about natively."""
+
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def iter_json_object(fields: Mapping[str, Any]) -> Iterator[bytes]:
+    """Encode ``fields`` as a JSON object in chunks.
+
+    Values that are iterators (e.g. generator expressions) are emitted as JSON
+    arrays one element at a time, so large collections never exist as a full
+    list of dicts or as one encoded buffer.
+    """
+
+    yield b"{"
+    for index, (key, value) in enumerate(fields.items()):
+        yield (b"," if index else b"") + orjson.dumps(key) + b":"
+        if isinstance(value, Iterator):
+            yield b"["
+            for position, item in enumerate(value):
+                yield (b"," if position else b"") + orjson.dumps(item, default=_default)
+            yield b"]"
+        else:
+            yield orjson.dumps(value, default=_default)
+    yield b"}"
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Dates and datetimes are encoded natively in ISO 8601, so models hand them
+    over as-is instead of calling ``isoformat()`` themselves.
+    """
+
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default),
+            mimetype=self.mimetype,
+        )
@@ -2,13 +2,47 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from flask import g, has_app_context
+from sqlalchemy import and_, event, func
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import joinedload, selectinload, validates
 
 from .database import db
 
 
+def _make_serializer(*fields: str) -> Callable[..., Dict]:
+    """Generate a ``to_dict`` helper returning a literal dict of ``fields``.
+
+    The function body is compiled once per model, so each call is a single
+    dict display of direct attribute loads. ``fields`` is kept on the returned
+    function so list endpoints can select the same columns without the ORM.
+    """
+
+    items = ", ".join(f"{field!r}: self.{field}" for field in fields)
+    namespace: Dict = {}
+    exec(f"def serialize(self):\n    return {{{items}}}\n", namespace)
+    serialize = namespace["serialize"]
+    serialize.fields = fields
+    return serialize
+
+
+def _today() -> date:
+    """Return the current UTC date, read once per request inside an app context."""
+
+    if not has_app_context():
+        return datetime.utcnow().date()
+    if "_today" not in g:
+        g._today = datetime.utcnow().date()
+    return g._today
+
+
 class TimestampMixin:
+    # Stamped in Python rather than with SQL ``now()``: SQLite's
+    # CURRENT_TIMESTAMP has one-second resolution and PostgreSQL's now() is
+    # the transaction start in the session time zone.
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
@@ -29,19 +63,68 @@ class Client(TimestampMixin, db.Model):
     remote_desktop_id = db.Column(db.String(50))
     theme_preference = db.Column(db.String(20), default="light", nullable=False)
     company = db.relationship("Company", back_populates="clients")
-    notes = db.relationship("ClientNote", backref="client", cascade="all, delete")
-    assets = db.relationship("Asset", backref="client", cascade="all, delete")
-    contracts = db.relationship("ServiceContract", backref="client", cascade="all, delete")
-    tickets = db.relationship("Ticket", backref="client", cascade="all, delete")
-    tasks = db.relationship("Task", backref="client", cascade="all, delete")
+    notes = db.relationship(
+        "ClientNote", backref="client", cascade="all, delete", passive_deletes=True
+    )
+    assets = db.relationship(
+        "Asset", backref="client", cascade="all, delete", passive_deletes=True
+    )
+    contracts = db.relationship(
+        "ServiceContract", backref="client", cascade="all, delete", passive_deletes=True
+    )
+    tickets = db.relationship(
+        "Ticket", backref="client", cascade="all, delete", passive_deletes=True
+    )
+    tasks = db.relationship(
+        "Task", backref="client", cascade="all, delete", passive_deletes=True
+    )
     appointments = db.relationship(
-        "Appointment", backref="client", cascade="all, delete"
+        "Appointment", backref="client", cascade="all, delete", passive_deletes=True
     )
     monitoring_incidents = db.relationship(
-        "MonitoringIncident", back_populates="client", cascade="all, delete"
+        "MonitoringIncident",
+        back_populates="client",
+        cascade="all, delete",
+        passive_deletes=True,
     )
     knowledge_articles = db.relationship(
-        "KnowledgeBaseArticle", back_populates="client", cascade="all, delete"
+        "KnowledgeBaseArticle",
+        back_populates="client",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+
+    @classmethod
+    def query_with_children(cls):
+        """Return a query that eagerly loads everything :meth:`to_dict` touches."""
+
+        return cls.query.options(
+            joinedload(cls.company),
+            selectinload(cls.assets),
+            selectinload(cls.contracts),
+            selectinload(cls.tasks),
+            selectinload(cls.appointments),
+            selectinload(cls.monitoring_incidents).joinedload(
+                MonitoringIncident.ticket
+            ),
+            selectinload(
+                cls.knowledge_articles.and_(
+                    KnowledgeBaseArticle.is_published.is_(True)
+                )
+            ),
+        )
+
+    _serialize = _make_serializer(
+        "id",
+        "name",
+        "email",
+        "phone",
+        "address",
+        "remote_support_tool",
+        "remote_desktop_id",
+        "theme_preference",
+        "created_at",
+        "updated_at",
     )
 
     def to_dict(self) -> Dict:
@@ -52,34 +135,28 @@ class Client(TimestampMixin, db.Model):
             company_payload = {"name": self.company_name}
         else:
             company_payload = None
-        return {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "phone": self.phone,
-            "company": company_payload,
-            "address": self.address,
-            "remote_support_tool": self.remote_support_tool,
-            "remote_desktop_id": self.remote_desktop_id,
-            "theme_preference": self.theme_preference,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "assets": [asset.to_dict() for asset in self.assets],
-            "contracts": [contract.to_dict() for contract in self.contracts],
-            "tasks": [task.to_dict() for task in self.tasks],
-            "appointments": [
-                appointment.to_dict() for appointment in self.appointments
-            ],
-            "monitoring_incidents": [
-                incident.to_dict(include_ticket=True)
-                for incident in self.monitoring_incidents
-            ],
-            "knowledge_base_articles": [
-                article.to_dict()
-                for article in self.knowledge_articles
-                if article.is_published
-            ],
-        }
+        payload = self._serialize()
+        payload.update(
+            {
+                "company": company_payload,
+                "assets": [asset.to_dict() for asset in self.assets],
+                "contracts": [contract.to_dict() for contract in self.contracts],
+                "tasks": [task.to_dict() for task in self.tasks],
+                "appointments": [
+                    appointment.to_dict() for appointment in self.appointments
+                ],
+                "monitoring_incidents": [
+                    incident.to_dict(include_ticket=True)
+                    for incident in self.monitoring_incidents
+                ],
+                "knowledge_base_articles": [
+                    article.to_dict()
+                    for article in self.knowledge_articles
+                    if article.is_published
+                ],
+            }
+        )
+        return payload
 
 
 class Company(TimestampMixin, db.Model):
@@ -91,116 +168,184 @@ class Company(TimestampMixin, db.Model):
     headquarters = db.Column(db.String(255))
     clients = db.relationship("Client", back_populates="company")
 
+    _serialize = _make_serializer(
+        "id",
+        "name",
+        "industry",
+        "headquarters",
+        "created_at",
+        "updated_at",
+    )
+
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "industry": self.industry,
-            "headquarters": self.headquarters,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        # Client lists usually share a handful of companies, so render each
+        # company once per request and reuse the payload.
+        if self.id is None or not has_app_context():
+            return self._serialize()
+        cache = g.setdefault("_company_cache", {})
+        payload = cache.get(self.id)
+        if payload is None:
+            payload = cache[self.id] = self._serialize()
+        return payload
 
 
 class ClientNote(TimestampMixin, db.Model):
     __tablename__ = "client_notes"
 
     id = db.Column(db.Integer, primary_key=True)
-    client_id = db.Column(db.Integer, db.ForeignKey("clients.id"), nullable=False)
+    client_id = db.Column(
+        db.Integer,
+        db.ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     author = db.Column(db.String(120), nullable=False)
     body = db.Column(db.Text, nullable=False)
 
+    _serialize = _make_serializer(
+        "id",
+        "client_id",
+        "author",
+        "body",
+        "created_at",
+    )
+
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "client_id": self.client_id,
-            "author": self.author,
-            "body": self.body,
-            "created_at": self.created_at.isoformat(),
-        }
+        return self._serialize()
 
 
 class Asset(TimestampMixin, db.Model):
     __tablename__ = "assets"
 
     id = db.Column(db.Integer, primary_key=True)
-    client_id = db.Column(db.Integer, db.ForeignKey("clients.id"), nullable=False)
+    client_id = db.Column(
+        db.Integer,
+        db.ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     name = db.Column(db.String(120), nullable=False)
     serial_number = db.Column(db.String(120))
     asset_type = db.Column(db.String(120))
     status = db.Column(db.String(50), default="active", nullable=False)
     location = db.Column(db.String(255))
 
+    _serialize = _make_serializer(
+        "id",
+        "client_id",
+        "name",
+        "serial_number",
+        "asset_type",
+        "status",
+        "location",
+        "created_at",
+    )
+
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "client_id": self.client_id,
-            "name": self.name,
-            "serial_number": self.serial_number,
-            "asset_type": self.asset_type,
-            "status": self.status,
-            "location": self.location,
-            "created_at": self.created_at.isoformat(),
-        }
+        return self._serialize()
 
 
 class ServiceContract(TimestampMixin, db.Model):
     __tablename__ = "service_contracts"
 
     id = db.Column(db.Integer, primary_key=True)
-    client_id = db.Column(db.Integer, db.ForeignKey("clients.id"), nullable=False)
+    client_id = db.Column(
+        db.Integer,
+        db.ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     title = db.Column(db.String(120), nullable=False)
     description = db.Column(db.Text)
     start_date = db.Column(db.Date, nullable=False)
     end_date = db.Column(db.Date, nullable=False)
     support_level = db.Column(db.String(120))
 
+    __table_args__ = (db.Index("ix_contract_window", "start_date", "end_date"),)
+
+    @hybrid_property
+    def is_active(self) -> bool:
+        return self.start_date <= _today() <= self.end_date
+
+    @is_active.expression
+    def is_active(cls):
+        return and_(
+            cls.start_date <= func.current_date(), cls.end_date >= func.current_date()
+        )
+
+    _serialize = _make_serializer(
+        "id",
+        "client_id",
+        "title",
+        "description",
+        "start_date",
+        "end_date",
+        "support_level",
+        "is_active",
+    )
+
     def to_dict(self) -> Dict:
-        today = datetime.utcnow().date()
-        return {
-            "id": self.id,
-            "client_id": self.client_id,
-            "title": self.title,
-            "description": self.description,
-            "start_date": self.start_date.isoformat(),
-            "end_date": self.end_date.isoformat(),
-            "support_level": self.support_level,
-            "is_active": self.start_date <= today <= self.end_date,
-        }
+        return self._serialize()
 
 
 class Ticket(TimestampMixin, db.Model):
     __tablename__ = "tickets"
 
     id = db.Column(db.Integer, primary_key=True)
-    client_id = db.Column(db.Integer, db.ForeignKey("clients.id"), nullable=False)
+    client_id = db.Column(
+        db.Integer,
+        db.ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+    )
     subject = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
     priority = db.Column(db.String(50), default="normal", nullable=False)
     status = db.Column(db.String(50), default="open", nullable=False)
     assigned_to = db.Column(db.String(120))
     due_date = db.Column(db.Date)
-    notes = db.relationship("TicketNote", backref="ticket", cascade="all, delete")
+    notes = db.relationship(
+        "TicketNote", backref="ticket", cascade="all, delete", passive_deletes=True
+    )
     monitoring_incident = db.relationship(
         "MonitoringIncident",
         back_populates="ticket",
         uselist=False,
         foreign_keys="MonitoringIncident.ticket_id",
+        passive_deletes=True,
     )
 
+    __table_args__ = (
+        db.Index("ix_ticket_client_status", "client_id", "status"),
+        # Backs ``status = ? ORDER BY priority, created_at`` in the ticket list.
+        db.Index("ix_ticket_status_priority", "status", "priority", "created_at"),
+        # Open tickets are the common filter; PostgreSQL gets a partial index.
+        db.Index(
+            "ix_ticket_open",
+            "priority",
+            "created_at",
+            postgresql_where=db.text("status = 'open'"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    _serialize = _make_serializer(
+        "id",
+        "client_id",
+        "subject",
+        "description",
+        "priority",
+        "status",
+        "assigned_to",
+        "due_date",
+        "created_at",
+        "updated_at",
+    )
+
+    # The subset embedded in monitoring incidents; the ticket endpoints
+    # return the full :meth:`to_dict` payload.
+    to_summary_dict = _make_serializer("id", "subject", "status", "priority")
+
     def to_dict(self, include_notes: bool = False) -> Dict:
-        payload = {
-            "id": self.id,
-            "client_id": self.client_id,
-            "subject": self.subject,
-            "description": self.description,
-            "priority": self.priority,
-            "status": self.status,
-            "assigned_to": self.assigned_to,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        payload: Dict = self._serialize()
         if include_notes:
             payload["notes"] = [note.to_dict() for note in self.notes]
         if self.monitoring_incident:
@@ -212,25 +357,32 @@ class TicketNote(TimestampMixin, db.Model):
     __tablename__ = "ticket_notes"
 
     id = db.Column(db.Integer, primary_key=True)
-    ticket_id = db.Column(db.Integer, db.ForeignKey("tickets.id"), nullable=False)
+    ticket_id = db.Column(
+        db.Integer,
+        db.ForeignKey("tickets.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     author = db.Column(db.String(120), nullable=False)
     body = db.Column(db.Text, nullable=False)
 
+    _serialize = _make_serializer(
+        "id",
+        "ticket_id",
+        "author",
+        "body",
+        "created_at",
+    )
+
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "ticket_id": self.ticket_id,
-            "author": self.author,
-            "body": self.body,
-            "created_at": self.created_at.isoformat(),
-        }
+        return self._serialize()
 
 
 class Task(TimestampMixin, db.Model):
     __tablename__ = "tasks"
 
     id = db.Column(db.Integer, primary_key=True)
-    client_id = db.Column(db.Integer, db.ForeignKey("clients.id"))
+    client_id = db.Column(db.Integer, db.ForeignKey("clients.id", ondelete="CASCADE"))
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
     status = db.Column(db.String(50), default="pending", nullable=False)
@@ -240,56 +392,85 @@ class Task(TimestampMixin, db.Model):
     completed_at = db.Column(db.DateTime)
     created_by = db.Column(db.String(120))
 
+    __table_args__ = (
+        db.Index("ix_task_client_status_due", "client_id", "status", "due_date"),
+        db.Index("ix_task_client_due", "client_id", "due_date", "priority"),
+        db.Index("ix_task_status_due", "status", "due_date"),
+        db.Index(
+            "ix_task_open",
+            "due_date",
+            postgresql_where=db.text("status <> 'completed'"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    _serialize = _make_serializer(
+        "id",
+        "client_id",
+        "title",
+        "description",
+        "status",
+        "priority",
+        "due_date",
+        "assigned_to",
+        "completed_at",
+        "created_by",
+        "created_at",
+        "updated_at",
+    )
+
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "client_id": self.client_id,
-            "title": self.title,
-            "description": self.description,
-            "status": self.status,
-            "priority": self.priority,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "assigned_to": self.assigned_to,
-            "completed_at": self.completed_at.isoformat()
-            if self.completed_at
-            else None,
-            "created_by": self.created_by,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        return self._serialize()
 
 
 class Appointment(TimestampMixin, db.Model):
     __tablename__ = "appointments"
 
     id = db.Column(db.Integer, primary_key=True)
-    client_id = db.Column(db.Integer, db.ForeignKey("clients.id"), nullable=False)
+    client_id = db.Column(
+        db.Integer,
+        db.ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+    )
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
     start_time = db.Column(db.DateTime, nullable=False)
     duration_minutes = db.Column(db.Integer, default=60, nullable=False)
+    # Materialised on write by :func:`_set_appointment_end_time`.
+    end_time = db.Column(db.DateTime, nullable=False)
     status = db.Column(db.String(50), default="scheduled", nullable=False)
     assigned_to = db.Column(db.String(120))
     location = db.Column(db.String(255))
     notes = db.Column(db.Text)
 
+    __table_args__ = (
+        db.Index("ix_appt_window", "start_time", "end_time"),
+        db.Index("ix_appt_client_start", "client_id", "start_time"),
+        db.Index(
+            "ix_appt_status_start",
+            "status",
+            "start_time",
+            postgresql_include=["assigned_to", "client_id", "duration_minutes"],
+        ),
+    )
+
+    _serialize = _make_serializer(
+        "id",
+        "client_id",
+        "title",
+        "description",
+        "start_time",
+        "end_time",
+        "duration_minutes",
+        "status",
+        "assigned_to",
+        "location",
+        "notes",
+        "created_at",
+        "updated_at",
+    )
+
     def to_dict(self, include_client: bool = False) -> Dict:
-        end_time = self.start_time + timedelta(minutes=self.duration_minutes)
-        payload: Dict = {
-            "id": self.id,
-            "client_id": self.client_id,
-            "title": self.title,
-            "description": self.description,
-            "start_time": self.start_time.isoformat(),
-            "end_time": end_time.isoformat(),
-            "duration_minutes": self.duration_minutes,
-            "status": self.status,
-            "assigned_to": self.assigned_to,
-            "location": self.location,
-            "notes": self.notes,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        payload: Dict = self._serialize()
         if include_client and self.client:
             payload["client"] = {
                 "id": self.client.id,
@@ -299,6 +480,17 @@ class Appointment(TimestampMixin, db.Model):
         return payload
 
 
+@event.listens_for(Appointment, "before_insert")
+@event.listens_for(Appointment, "before_update")
+def _set_appointment_end_time(mapper, connection, target: Appointment) -> None:
+    """Keep the stored ``end_time`` in sync with start time and duration."""
+
+    duration = target.duration_minutes
+    if duration is None:
+        duration = Appointment.__table__.c.duration_minutes.default.arg
+    target.end_time = target.start_time + timedelta(minutes=duration)
+
+
 class User(TimestampMixin, db.Model):
     __tablename__ = "users"
 
@@ -310,30 +502,38 @@ class User(TimestampMixin, db.Model):
     two_factor_secret = db.Column(db.String(32))
     theme_preference = db.Column(db.String(20), default="light", nullable=False)
 
+    _serialize = _make_serializer(
+        "id",
+        "username",
+        "email",
+        "two_factor_enabled",
+        "theme_preference",
+        "created_at",
+        "updated_at",
+    )
+
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "username": self.username,
-            "email": self.email,
-            "two_factor_enabled": self.two_factor_enabled,
-            "theme_preference": self.theme_preference,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        return self._serialize()
 
 
 class MonitoringIncident(TimestampMixin, db.Model):
     __tablename__ = "monitoring_incidents"
 
     id = db.Column(db.Integer, primary_key=True)
-    client_id = db.Column(db.Integer, db.ForeignKey("clients.id"), nullable=False)
+    client_id = db.Column(
+        db.Integer,
+        db.ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+    )
     source = db.Column(db.String(50), default="zabbix", nullable=False)
     external_id = db.Column(db.String(120), nullable=False)
     severity = db.Column(db.String(50), nullable=False)
     message = db.Column(db.Text, nullable=False)
     status = db.Column(db.String(50), default="open", nullable=False)
     occurred_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    ticket_id = db.Column(db.Integer, db.ForeignKey("tickets.id"))
+    ticket_id = db.Column(
+        db.Integer, db.ForeignKey("tickets.id", ondelete="SET NULL"), index=True
+    )
 
     client = db.relationship("Client", back_populates="monitoring_incidents")
     ticket = db.relationship(
@@ -342,24 +542,29 @@ class MonitoringIncident(TimestampMixin, db.Model):
         foreign_keys=ticket_id,
     )
 
-    __table_args__ = (db.UniqueConstraint("source", "external_id", name="uq_incident_source"),)
+    __table_args__ = (
+        db.UniqueConstraint("source", "external_id", name="uq_incident_source"),
+        db.Index("ix_incident_client_status", "client_id", "status"),
+    )
+
+    _serialize = _make_serializer(
+        "id",
+        "client_id",
+        "source",
+        "external_id",
+        "severity",
+        "message",
+        "status",
+        "occurred_at",
+        "created_at",
+        "updated_at",
+        "ticket_id",
+    )
 
     def to_dict(self, include_ticket: bool = False) -> Dict:
-        payload: Dict = {
-            "id": self.id,
-            "client_id": self.client_id,
-            "source": self.source,
-            "external_id": self.external_id,
-            "severity": self.severity,
-            "message": self.message,
-            "status": self.status,
-            "occurred_at": self.occurred_at.isoformat(),
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "ticket_id": self.ticket_id,
-        }
+        payload: Dict = self._serialize()
         if include_ticket and self.ticket:
-            payload["ticket"] = self.ticket.to_dict()
+            payload["ticket"] = self.ticket.to_summary_dict()
         return payload
 
 
@@ -371,28 +576,42 @@ class KnowledgeBaseArticle(TimestampMixin, db.Model):
     summary = db.Column(db.String(255))
     body = db.Column(db.Text, nullable=False)
     category = db.Column(db.String(120))
-    tags = db.Column(db.Text)
+    tags = db.Column(db.JSON, nullable=False, default=list)
     author = db.Column(db.String(120))
     is_published = db.Column(db.Boolean, default=True, nullable=False)
-    client_id = db.Column(db.Integer, db.ForeignKey("clients.id"))
+    client_id = db.Column(db.Integer, db.ForeignKey("clients.id", ondelete="CASCADE"))
 
     client = db.relationship("Client", back_populates="knowledge_articles")
 
+    __table_args__ = (
+        db.Index("ix_kb_client_pub", "client_id", "is_published", "updated_at"),
+        db.Index("ix_kb_pub_updated", "is_published", "updated_at"),
+    )
+
+    _serialize = _make_serializer(
+        "id",
+        "title",
+        "summary",
+        "body",
+        "category",
+        "tags",
+        "author",
+        "is_published",
+        "client_id",
+        "created_at",
+        "updated_at",
+    )
+
+    @validates("tags")
+    def validate_tags(self, key: str, value) -> List[str]:
+        """Store tags as a clean list, accepting comma-separated strings too."""
+
+        if isinstance(value, str):
+            value = value.split(",")
+        return [str(tag).strip() for tag in value or [] if str(tag).strip()]
+
     def to_dict(self) -> Dict:
-        tag_list = [tag.strip() for tag in (self.tags or "").split(",") if tag.strip()]
-        return {
-            "id": self.id,
-            "title": self.title,
-            "summary": self.summary,
-            "body": self.body,
-            "category": self.category,
-            "tags": tag_list,
-            "author": self.author,
-            "is_published": self.is_published,
-            "client_id": self.client_id,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        return self._serialize()
 
 
 def serialize_collection(items: List) -> List[Dict]:
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import os
 import platform
+import re
 import shutil
 import subprocess
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RemoteAccessStatus:
     """Information about the state of the remote support tooling."""
 
@@ -30,20 +32,66 @@ ANYDESK_CANDIDATES = [
     "/Applications/AnyDesk.app/Contents/MacOS/AnyDesk",
 ]
 
+ANYDESK_CONFIG_CANDIDATES = [
+    "/etc/anydesk/system.conf",
+    os.path.expanduser("~/.anydesk/system.conf"),
+] + [
+    os.path.join(os.environ[variable], "AnyDesk", "system.conf")
+    for variable in ("PROGRAMDATA", "APPDATA")
+    if os.environ.get(variable)
+]
+
+# On POSIX the AnyDesk CLI only needs PATH and HOME, so the full environment is
+# not copied. On Windows it is inherited (``None``): the client locates its
+# configuration through PROGRAMDATA, APPDATA, USERPROFILE and TEMP.
+if platform.system() == "Windows":
+    ANYDESK_CLI_ENV = None
+else:
+    ANYDESK_CLI_ENV = {
+        variable: os.environ[variable]
+        for variable in ("PATH", "HOME")
+        if variable in os.environ
+    }
+
+ANYDESK_ID_PATTERN = re.compile(r"^ad\.anynet\.id=(\d+)", re.M)
+
+
+# Location of the AnyDesk executable once found; see find_anydesk_executable.
+_anydesk_executable: Optional[str] = None
+
 
 def find_anydesk_executable() -> Optional[str]:
-    """Return the path to the AnyDesk executable if it exists."""
+    """Return the path to the AnyDesk executable if it exists.
+
+    The lookup scans ``PATH`` and several install locations, so a found path is
+    cached. A miss is not, so an AnyDesk installed by hand is picked up on the
+    next call; :func:`reset_anydesk_cache` forgets a path that moved.
+    """
+
+    global _anydesk_executable
+    if _anydesk_executable is None:
+        _anydesk_executable = _locate_anydesk()
+    return _anydesk_executable
+
 
+def _locate_anydesk() -> Optional[str]:
     executable = shutil.which("anydesk")
     if executable:
         return executable
 
     for candidate in ANYDESK_CANDIDATES:
-        if os.path.exists(candidate):
+        if os.path.isfile(candidate):
             return candidate
     return None
 
 
+def reset_anydesk_cache() -> None:
+    """Forget the cached AnyDesk executable location."""
+
+    global _anydesk_executable
+    _anydesk_executable = None
+
+
 def install_anydesk() -> tuple[bool, str]:
     """Try to install AnyDesk using the platform package manager."""
 
@@ -97,16 +145,36 @@ def install_anydesk() -> tuple[bool, str]:
     return False, "Неизвестная платформа. Установите AnyDesk вручную."
 
 
+def read_anydesk_id_from_config() -> Optional[str]:
+    """Read the desktop ID from AnyDesk's ``system.conf`` if it is available."""
+
+    for candidate in ANYDESK_CONFIG_CANDIDATES:
+        try:
+            contents = Path(candidate).read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            continue
+        match = ANYDESK_ID_PATTERN.search(contents)
+        if match:
+            return match.group(1)
+    return None
+
+
 def fetch_anydesk_id(executable: str) -> Optional[str]:
-    """Run AnyDesk CLI to obtain the desktop ID if supported."""
+    """Obtain the desktop ID, preferring the config file over the AnyDesk CLI."""
+
+    desk_id = read_anydesk_id_from_config()
+    if desk_id:
+        return desk_id
 
     try:
         result = subprocess.run(
             [executable, "--get-id"],
             check=True,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
+            stderr=subprocess.DEVNULL,
             text=True,
+            close_fds=False,
+            env=ANYDESK_CLI_ENV,
         )
     except FileNotFoundError:
         return None
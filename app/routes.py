@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, time, timedelta, timezone
+import heapq
+from collections import Counter
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
 
-from flask import Blueprint, abort, jsonify, request
+from flask import Blueprint, abort, current_app, jsonify, request, stream_with_context
+from sqlalchemy import and_, case, func, insert, or_, select
+from sqlalchemy.orm import joinedload, selectinload
 from werkzeug.security import check_password_hash, generate_password_hash
 
 import pyotp
 
+from .cache import response_cache
 from .database import db
+from .json_provider import iter_json_object
 from .models import (
     Appointment,
     Asset,
@@ -27,12 +32,33 @@ from .models import (
     User,
     serialize_collection,
 )
-from .remote import ensure_anydesk
 
 crm_bp = Blueprint("crm", __name__, url_prefix="/api")
 
 
-ALLOWED_APPOINTMENT_STATUSES = {"scheduled", "completed", "cancelled"}
+@crm_bp.after_request
+def invalidate_cached_reads(response):
+    """Cached dashboards must not outlive a successful write."""
+
+    if request.method != "GET" and response.status_code < 400:
+        response_cache.clear()
+    return response
+
+
+ALLOWED_APPOINTMENT_STATUSES = frozenset({"scheduled", "completed", "cancelled"})
+ALLOWED_THEMES = frozenset({"light", "dark"})
+RESOLVED_INCIDENT_STATUSES = frozenset({"resolved", "ok"})
+REQUIRED_CLIENT_FIELDS = ("name", "email")
+REQUIRED_ZABBIX_FIELDS = ("event_id", "client_id", "severity", "message")
+MAX_PAGE_SIZE = 500
+# Plain columns the update endpoints copy straight from the payload.
+CLIENT_UPDATE_FIELDS = ("name", "email", "phone", "address")
+APPOINTMENT_UPDATE_FIELDS = ("title", "description", "assigned_to", "location", "notes")
+TICKET_UPDATE_FIELDS = ("subject", "description", "priority", "status", "assigned_to")
+COMPANY_UPDATE_FIELDS = ("name", "industry", "headquarters")
+ARTICLE_UPDATE_FIELDS = ("title", "summary", "body", "category", "author")
+TASK_UPDATE_FIELDS = ("title", "description", "status", "priority", "assigned_to", "created_by")
+
 SEVERITY_PRIORITY_MAP = {
     "disaster": "high",
     "high": "high",
@@ -43,27 +69,67 @@ SEVERITY_PRIORITY_MAP = {
 }
 
 
-def calculate_churn_risk(
-    client: Client,
+def count_where(condition) -> Any:
+    """Return a SQL expression counting the rows that match ``condition``."""
+
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def select_serialized(model) -> Any:
+    """Select the columns of ``model``'s ``to_dict`` payload as plain rows.
+
+    Only valid for models whose ``to_dict`` is the flat ``_serialize`` output;
+    rows come back as mappings, skipping ORM instance construction.
+    """
+
+    return select(*(getattr(model, field) for field in model._serialize.fields))
+
+
+def fetch_serialized(statement) -> list[Dict]:
+    """Execute a :func:`select_serialized` statement into JSON-ready dicts."""
+
+    return [dict(row) for row in db.session.execute(statement).mappings()]
+
+
+def count_rows(model, *criteria) -> Any:
+    """Return a scalar subquery counting ``model`` rows matching ``criteria``."""
+
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+
+def count_churn_signals(
     tickets: list[Ticket],
     tasks: list[Task],
     appointments: list[Appointment],
-) -> Tuple[float, str]:
-    """Return a churn probability and label based on lightweight heuristics."""
-
-    open_tickets = sum(1 for ticket in tickets if ticket.status == "open")
-    high_priority = sum(
-        1 for ticket in tickets if ticket.status == "open" and ticket.priority == "high"
-    )
+    today: date,
+) -> Tuple[int, int, int, int]:
+    """Count the inputs of :func:`calculate_churn_risk` from loaded rows."""
+
+    open_tickets = high_priority = 0
+    for ticket in tickets:
+        if ticket.status == "open":
+            open_tickets += 1
+            if ticket.priority == "high":
+                high_priority += 1
     overdue_tasks = sum(
         1
         for task in tasks
         if task.status != "completed"
         and task.due_date
-        and task.due_date < datetime.utcnow().date()
+        and task.due_date < today
     )
     missed_appointments = sum(1 for appt in appointments if appt.status == "cancelled")
-    days_since_touch = (datetime.utcnow() - client.updated_at).days
+    return open_tickets, high_priority, overdue_tasks, missed_appointments
+
+
+def calculate_churn_risk(
+    open_tickets: int,
+    high_priority: int,
+    overdue_tasks: int,
+    missed_appointments: int,
+    days_since_touch: int,
+) -> Tuple[float, str]:
+    """Return a churn probability and label based on lightweight heuristics."""
 
     probability = 0.05
     probability += min(0.3, open_tickets * 0.05)
@@ -85,17 +151,19 @@ def calculate_churn_risk(
 def calculate_engineer_load(tasks: list[Task], appointments: list[Appointment]) -> Dict[str, Any]:
     """Derive engineer utilisation metrics."""
 
-    workload = defaultdict(lambda: {"open_tasks": 0, "scheduled_minutes": 0})
-    for task in tasks:
-        if task.status != "completed" and task.assigned_to:
-            workload[task.assigned_to]["open_tasks"] += 1
+    open_tasks: Counter[str] = Counter(
+        task.assigned_to
+        for task in tasks
+        if task.status != "completed" and task.assigned_to
+    )
+    scheduled_minutes: Counter[str] = Counter()
     for appointment in appointments:
         if appointment.status == "scheduled" and appointment.assigned_to:
-            workload[appointment.assigned_to]["scheduled_minutes"] += appointment.duration_minutes
+            scheduled_minutes[appointment.assigned_to] += appointment.duration_minutes
     forecasts = []
-    for engineer, data in workload.items():
-        utilisation = min(1.0, (data["scheduled_minutes"] / (8 * 60)))
-        score = min(1.0, (data["open_tasks"] * 0.05) + utilisation)
+    for engineer in dict.fromkeys([*open_tasks, *scheduled_minutes]):
+        utilisation = min(1.0, (scheduled_minutes[engineer] / (8 * 60)))
+        score = min(1.0, (open_tasks[engineer] * 0.05) + utilisation)
         status = "balanced"
         if score >= 0.8:
             status = "overloaded"
@@ -104,8 +172,8 @@ def calculate_engineer_load(tasks: list[Task], appointments: list[Appointment])
         forecasts.append(
             {
                 "engineer": engineer,
-                "open_tasks": data["open_tasks"],
-                "scheduled_minutes": data["scheduled_minutes"],
+                "open_tasks": open_tasks[engineer],
+                "scheduled_minutes": scheduled_minutes[engineer],
                 "utilisation": round(utilisation, 2),
                 "status": status,
             }
@@ -113,6 +181,18 @@ def calculate_engineer_load(tasks: list[Task], appointments: list[Appointment])
     return {"engineers": forecasts}
 
 
+def sort_tasks(tasks: list[Task]) -> list[Task]:
+    """Order tasks like ``ORDER BY due_date, priority DESC, created_at DESC``."""
+
+    ordered = sorted(tasks, key=lambda task: task.created_at, reverse=True)
+    ordered.sort(key=lambda task: task.priority, reverse=True)
+    # SQLite sorts NULL due dates first.
+    ordered.sort(
+        key=lambda task: (task.due_date is not None, task.due_date or date.min)
+    )
+    return ordered
+
+
 def parse_json() -> Dict[str, Any]:
     if not request.is_json:
         abort(400, description="Request must be JSON")
@@ -120,7 +200,7 @@ def parse_json() -> Dict[str, Any]:
 
 
 def sanitise_theme(value: Optional[str]) -> str:
-    if value and value.lower() in {"light", "dark"}:
+    if value and value.lower() in ALLOWED_THEMES:
         return value.lower()
     return "light"
 
@@ -150,15 +230,82 @@ def parse_iso_datetime(value: str, field_name: str) -> datetime:
     return dt
 
 
+def parse_iso_date(value: str, field_name: str) -> date:
+    """Parse the calendar date of an ISO date or datetime, as given."""
+
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError as exc:
+        abort(400, description=f"Invalid {field_name}: {exc}")
+
+
+def paginate(query: Any) -> Any:
+    """Apply the optional ``limit``/``offset`` query parameters to ``query``.
+
+    Without either parameter the full list is returned, as before; ``limit``
+    is capped at ``MAX_PAGE_SIZE``.
+    """
+
+    limit_arg = request.args.get("limit")
+    offset_arg = request.args.get("offset")
+    if limit_arg is None and offset_arg is None:
+        return query
+    try:
+        limit = int(limit_arg) if limit_arg else MAX_PAGE_SIZE
+        offset = int(offset_arg) if offset_arg else 0
+    except ValueError:
+        abort(400, description="Invalid pagination parameters")
+    if limit < 1 or offset < 0:
+        abort(400, description="Invalid pagination parameters")
+    return query.limit(min(limit, MAX_PAGE_SIZE)).offset(offset)
+
+
+def apply_updates(instance: Any, data: Dict[str, Any], fields: Tuple[str, ...]) -> None:
+    """Copy the ``fields`` present in ``data`` onto ``instance``."""
+
+    for field in fields:
+        if field in data:
+            setattr(instance, field, data[field])
+
+
+def parse_note_batch(data: Any, default_author: str) -> list[Dict[str, str]]:
+    """Validate a ``{"notes": [...]}`` payload into rows for a bulk insert."""
+
+    notes = data.get("notes") if isinstance(data, dict) else None
+    if not isinstance(notes, list) or not notes:
+        abort(400, description="notes must be a non-empty list")
+    if not all(isinstance(note, dict) for note in notes):
+        abort(400, description="Each note must be an object")
+    rows = [
+        {"author": note.get("author", default_author), "body": note.get("body", "")}
+        for note in notes
+    ]
+    if not all(isinstance(row["author"], str) for row in rows):
+        abort(400, description="Each note author must be a string")
+    if not all(isinstance(row["body"], str) for row in rows):
+        abort(400, description="Each note body must be a string")
+    return rows
+
+
 def require_company(company_id: int) -> Company:
-    company = Company.query.get(company_id)
+    company = db.session.get(Company, company_id)
     if not company:
         abort(404, description=f"Company with id {company_id} not found")
     return company
 
 
+def require_client_exists(client_id: int) -> None:
+    """Abort with 404 unless the client exists, without loading the row."""
+
+    exists = db.session.execute(
+        select(Client.id).where(Client.id == client_id)
+    ).scalar()
+    if exists is None:
+        abort(404)
+
+
 def require_user(user_id: int) -> User:
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
     if not user:
         abort(404, description=f"User with id {user_id} not found")
     return user
@@ -166,15 +313,14 @@ def require_user(user_id: int) -> User:
 
 @crm_bp.route("/clients", methods=["GET"])
 def list_clients():
-    clients = Client.query.order_by(Client.name).all()
+    clients = paginate(Client.query_with_children().order_by(Client.name)).all()
     return jsonify(serialize_collection(clients))
 
 
 @crm_bp.route("/clients", methods=["POST"])
 def create_client():
     data = parse_json()
-    required_fields = ["name", "email"]
-    if any(field not in data for field in required_fields):
+    if any(field not in data for field in REQUIRED_CLIENT_FIELDS):
         abort(400, description="Missing required client fields")
 
     company: Optional[Company] = None
@@ -202,8 +348,7 @@ def create_client():
 @crm_bp.route("/integrations/zabbix/events", methods=["POST"])
 def ingest_zabbix_event():
     data = parse_json()
-    required_fields = ["event_id", "client_id", "severity", "message"]
-    if any(field not in data for field in required_fields):
+    if any(field not in data for field in REQUIRED_ZABBIX_FIELDS):
         abort(400, description="Missing required Zabbix event fields")
 
     try:
@@ -211,18 +356,22 @@ def ingest_zabbix_event():
     except (TypeError, ValueError):
         abort(400, description="Invalid client id")
 
-    client = Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     severity = str(data["severity"]).lower()
     priority = SEVERITY_PRIORITY_MAP.get(severity, "normal")
 
-    existing = MonitoringIncident.query.filter_by(
-        source="zabbix", external_id=str(data["event_id"])
-    ).first()
+    # Resolved through the (source, external_id) unique index; the ticket is
+    # loaded alongside because both branches below render it.
+    existing = (
+        MonitoringIncident.query.options(joinedload(MonitoringIncident.ticket))
+        .filter_by(source="zabbix", external_id=str(data["event_id"]))
+        .first()
+    )
     if existing:
         if data.get("status"):
             new_status = str(data["status"]).lower()
             existing.status = new_status
-            if existing.ticket and new_status in {"resolved", "ok"}:
+            if existing.ticket and new_status in RESOLVED_INCIDENT_STATUSES:
                 existing.ticket.status = "resolved"
         existing.severity = severity
         existing.message = data["message"]
@@ -230,66 +379,72 @@ def ingest_zabbix_event():
         return jsonify(existing.to_dict(include_ticket=True))
 
     ticket_subject = data.get("problem") or f"Zabbix incident {data['event_id']}"
-    ticket_description = data["message"]
-    ticket = Ticket(
-        client_id=client.id,
-        subject=f"[Zabbix] {ticket_subject}",
-        description=ticket_description,
-        priority=priority,
-        status="open",
-        assigned_to=data.get("assigned_to") or "Monitoring",
-    )
-
-    if priority == "high":
-        ticket.due_date = datetime.utcnow().date() + timedelta(days=1)
-
-    occurred_at = datetime.utcnow()
+    now = datetime.utcnow()
+    occurred_at = now
     if data.get("occurred_at"):
-        try:
-            occurred_at = datetime.fromisoformat(data["occurred_at"])
-        except ValueError as exc:
-            abort(400, description=f"Invalid occurred_at: {exc}")
-
-    incident = MonitoringIncident(
-        client_id=client.id,
-        source="zabbix",
-        external_id=str(data["event_id"]),
-        severity=severity,
-        message=data["message"],
-        status=str(data.get("status", "open")).lower(),
-        occurred_at=occurred_at,
-    )
-
-    incident.ticket = ticket
-    db.session.add_all([ticket, incident])
+        occurred_at = parse_iso_datetime(data["occurred_at"], "occurred_at")
+
+    # Plain INSERTs: the rows are new and rendered from a fresh load below, so
+    # the unit of work has nothing to track.
+    ticket_id = db.session.execute(
+        insert(Ticket)
+        .values(
+            client_id=client_id,
+            subject=f"[Zabbix] {ticket_subject}",
+            description=data["message"],
+            priority=priority,
+            status="open",
+            assigned_to=data.get("assigned_to") or "Monitoring",
+            due_date=now.date() + timedelta(days=1) if priority == "high" else None,
+        )
+        .returning(Ticket.id)
+    ).scalar_one()
+    incident_id = db.session.execute(
+        insert(MonitoringIncident)
+        .values(
+            client_id=client_id,
+            source="zabbix",
+            external_id=str(data["event_id"]),
+            severity=severity,
+            message=data["message"],
+            status=str(data.get("status", "open")).lower(),
+            occurred_at=occurred_at,
+            ticket_id=ticket_id,
+        )
+        .returning(MonitoringIncident.id)
+    ).scalar_one()
     db.session.commit()
+
+    incident = (
+        MonitoringIncident.query.options(joinedload(MonitoringIncident.ticket))
+        .filter_by(id=incident_id)
+        .one()
+    )
     return jsonify(incident.to_dict(include_ticket=True)), 201
 
 
 @crm_bp.route("/clients/<int:client_id>", methods=["GET"])
 def get_client(client_id: int):
-    client = Client.query.get_or_404(client_id)
+    client = Client.query_with_children().get_or_404(client_id)
     return jsonify(client.to_dict())
 
 
 @crm_bp.route("/clients/<int:client_id>/assets", methods=["GET"])
 def list_client_assets(client_id: int):
-    Client.query.get_or_404(client_id)
-    assets = (
-        Asset.query.filter_by(client_id=client_id)
+    require_client_exists(client_id)
+    assets = fetch_serialized(
+        select_serialized(Asset)
+        .where(Asset.client_id == client_id)
         .order_by(Asset.created_at.desc())
-        .all()
     )
-    return jsonify([asset.to_dict() for asset in assets])
+    return jsonify(assets)
 
 
 @crm_bp.route("/clients/<int:client_id>", methods=["PUT"])
 def update_client(client_id: int):
-    client = Client.query.get_or_404(client_id)
+    client = db.get_or_404(Client, client_id)
     data = parse_json()
-    for field in ["name", "email", "phone", "address"]:
-        if field in data:
-            setattr(client, field, data[field])
+    apply_updates(client, data, CLIENT_UPDATE_FIELDS)
     if "company_name" in data or "company" in data:
         client.company_name = data.get("company_name") or data.get("company")
     if "company_id" in data:
@@ -308,8 +463,11 @@ def update_client(client_id: int):
 
 
 @crm_bp.route("/monitoring/incidents", methods=["GET"])
+@response_cache.cached(
+    timeout=60, query_args=("client_id", "status", "limit", "offset")
+)
 def list_monitoring_incidents():
-    query = MonitoringIncident.query
+    query = MonitoringIncident.query.options(joinedload(MonitoringIncident.ticket))
     if request.args.get("client_id"):
         try:
             client_id = int(request.args["client_id"])
@@ -318,13 +476,13 @@ def list_monitoring_incidents():
         query = query.filter_by(client_id=client_id)
     if request.args.get("status"):
         query = query.filter_by(status=request.args["status"].lower())
-    incidents = query.order_by(MonitoringIncident.occurred_at.desc()).all()
+    incidents = paginate(query.order_by(MonitoringIncident.occurred_at.desc())).all()
     return jsonify([incident.to_dict(include_ticket=True) for incident in incidents])
 
 
 @crm_bp.route("/monitoring/incidents/<int:incident_id>", methods=["PATCH"])
 def update_monitoring_incident(incident_id: int):
-    incident = MonitoringIncident.query.get_or_404(incident_id)
+    incident = db.get_or_404(MonitoringIncident, incident_id)
     data = parse_json()
     if "status" in data:
         incident.status = str(data["status"]).lower()
@@ -340,7 +498,7 @@ def update_monitoring_incident(incident_id: int):
                 ticket_id = int(data["ticket_id"])
             except (TypeError, ValueError):
                 abort(400, description="Invalid ticket id")
-            ticket = Ticket.query.get_or_404(ticket_id)
+            ticket = db.get_or_404(Ticket, ticket_id)
             incident.ticket = ticket
     db.session.commit()
     return jsonify(incident.to_dict(include_ticket=True))
@@ -348,7 +506,7 @@ def update_monitoring_incident(incident_id: int):
 
 @crm_bp.route("/clients/<int:client_id>", methods=["DELETE"])
 def delete_client(client_id: int):
-    client = Client.query.get_or_404(client_id)
+    client = db.get_or_404(Client, client_id)
     db.session.delete(client)
     db.session.commit()
     return "", 204
@@ -356,7 +514,7 @@ def delete_client(client_id: int):
 
 @crm_bp.route("/clients/<int:client_id>/assets", methods=["POST"])
 def create_asset(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     data = parse_json()
     asset = Asset(
         client_id=client_id,
@@ -373,7 +531,7 @@ def create_asset(client_id: int):
 
 @crm_bp.route("/clients/<int:client_id>/contracts", methods=["GET"])
 def list_client_contracts(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     contracts = (
         ServiceContract.query.filter_by(client_id=client_id)
         .order_by(ServiceContract.start_date.desc())
@@ -384,7 +542,7 @@ def list_client_contracts(client_id: int):
 
 @crm_bp.route("/clients/<int:client_id>/contracts", methods=["POST"])
 def create_contract(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     data = parse_json()
     try:
         start_date = datetime.fromisoformat(data["start_date"]).date()
@@ -407,7 +565,7 @@ def create_contract(client_id: int):
 
 @crm_bp.route("/clients/<int:client_id>/notes", methods=["GET"])
 def list_client_notes(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     notes = (
         ClientNote.query.filter_by(client_id=client_id)
         .order_by(ClientNote.created_at.desc())
@@ -418,7 +576,7 @@ def list_client_notes(client_id: int):
 
 @crm_bp.route("/clients/<int:client_id>/notes", methods=["POST"])
 def create_client_note(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     data = parse_json()
     note = ClientNote(
         client_id=client_id,
@@ -430,17 +588,45 @@ def create_client_note(client_id: int):
     return jsonify(note.to_dict()), 201
 
 
+@crm_bp.route("/clients/<int:client_id>/notes/bulk", methods=["POST"])
+def create_client_notes_bulk(client_id: int):
+    require_client_exists(client_id)
+    rows = parse_note_batch(parse_json(), "System")
+    notes = db.session.scalars(
+        insert(ClientNote).returning(ClientNote),
+        [{"client_id": client_id, **row} for row in rows],
+    ).all()
+    # Serialise before commit: committing expires the RETURNING rows, and
+    # reading them afterwards would reload every note with its own SELECT.
+    payload = [note.to_dict() for note in notes]
+    db.session.commit()
+    return jsonify(payload), 201
+
+
 @crm_bp.route("/clients/<int:client_id>/tickets", methods=["GET"])
 def list_client_tickets(client_id: int):
-    Client.query.get_or_404(client_id)
-    tickets = Ticket.query.filter_by(client_id=client_id).order_by(Ticket.created_at).all()
+    require_client_exists(client_id)
+    tickets = paginate(
+        Ticket.query.options(
+            selectinload(Ticket.notes), selectinload(Ticket.monitoring_incident)
+        )
+        .filter_by(client_id=client_id)
+        .order_by(Ticket.created_at)
+    ).all()
     return jsonify([ticket.to_dict(include_notes=True) for ticket in tickets])
 
 
 @crm_bp.route("/clients/<int:client_id>/overview", methods=["GET"])
 def client_overview(client_id: int):
-    client = Client.query.get_or_404(client_id)
-    today = datetime.utcnow().date()
+    client = (
+        Client.query_with_children()
+        .options(
+            selectinload(Client.notes),
+            selectinload(Client.tickets).selectinload(Ticket.notes),
+            selectinload(Client.tickets).selectinload(Ticket.monitoring_incident),
+        )
+        .get_or_404(client_id)
+    )
     now = datetime.utcnow()
 
     client_payload = client.to_dict()
@@ -449,22 +635,14 @@ def client_overview(client_id: int):
         for note in sorted(client.notes, key=lambda note: note.created_at, reverse=True)
     ]
 
-    tasks = (
-        Task.query.filter_by(client_id=client_id)
-        .order_by(Task.due_date, Task.priority.desc(), Task.created_at.desc())
-        .all()
-    )
-
-    tickets = (
-        Ticket.query.filter_by(client_id=client_id)
-        .order_by(Ticket.priority.desc(), Ticket.created_at.desc())
-        .all()
+    tasks = sort_tasks(client.tasks)
+    tickets = sorted(
+        client.tickets,
+        key=lambda ticket: (ticket.priority, ticket.created_at),
+        reverse=True,
     )
-
-    appointments = (
-        Appointment.query.filter_by(client_id=client_id)
-        .order_by(Appointment.start_time.asc())
-        .all()
+    appointments = sorted(
+        client.appointments, key=lambda appointment: appointment.start_time
     )
 
     upcoming_appointments = [
@@ -483,17 +661,16 @@ def client_overview(client_id: int):
     )
     open_incidents = [incident for incident in incident_history if incident.status != "resolved"]
 
+    churn_signals = count_churn_signals(tickets, tasks, appointments, now.date())
+    open_tickets, high_priority_open_tickets = churn_signals[:2]
+    open_tasks = sum(1 for task in tasks if task.status != "completed")
     metrics = {
         "total_assets": len(client.assets),
-        "active_contracts": sum(
-            1 for contract in client.contracts if contract.start_date <= today <= contract.end_date
-        ),
-        "open_tickets": sum(1 for ticket in tickets if ticket.status == "open"),
-        "high_priority_open_tickets": sum(
-            1 for ticket in tickets if ticket.status == "open" and ticket.priority == "high"
-        ),
-        "open_tasks": sum(1 for task in tasks if task.status != "completed"),
-        "completed_tasks": sum(1 for task in tasks if task.status == "completed"),
+        "active_contracts": sum(1 for contract in client.contracts if contract.is_active),
+        "open_tickets": open_tickets,
+        "high_priority_open_tickets": high_priority_open_tickets,
+        "open_tasks": open_tasks,
+        "completed_tasks": len(tasks) - open_tasks,
         "upcoming_appointments": len(upcoming_appointments),
         "completed_appointments": sum(
             1 for appointment in appointments if appointment.status == "completed"
@@ -503,7 +680,7 @@ def client_overview(client_id: int):
     }
 
     churn_probability, churn_label = calculate_churn_risk(
-        client, tickets, tasks, appointments
+        *churn_signals, (now - client.updated_at).days
     )
     engineer_load = calculate_engineer_load(tasks, appointments)
     client_payload["predictive_insights"] = {
@@ -512,20 +689,25 @@ def client_overview(client_id: int):
         "engineer_load": engineer_load,
     }
 
-    return jsonify(
+    # Tickets carry their note threads, so the collections are serialised
+    # while streaming instead of being built up as lists first.
+    body = iter_json_object(
         {
             "client": client_payload,
-            "tickets": [ticket.to_dict(include_notes=True) for ticket in tickets],
+            "tickets": (ticket.to_dict(include_notes=True) for ticket in tickets),
             "metrics": metrics,
-            "tasks": [task.to_dict() for task in tasks],
-            "appointments": [appointment.to_dict() for appointment in appointments],
+            "tasks": (task.to_dict() for task in tasks),
+            "appointments": (appointment.to_dict() for appointment in appointments),
         }
     )
+    return current_app.response_class(
+        stream_with_context(body), mimetype="application/json"
+    )
 
 
 @crm_bp.route("/clients/<int:client_id>/appointments", methods=["GET"])
 def list_client_appointments(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     status = request.args.get("status")
     query = Appointment.query.filter_by(client_id=client_id)
     if status:
@@ -536,7 +718,7 @@ def list_client_appointments(client_id: int):
 
 @crm_bp.route("/clients/<int:client_id>/appointments", methods=["POST"])
 def create_client_appointment(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     data = parse_json()
 
     if "start_time" not in data:
@@ -574,7 +756,9 @@ def list_appointments():
     from_arg = request.args.get("from")
     to_arg = request.args.get("to")
 
-    query = Appointment.query
+    query = Appointment.query.options(
+        joinedload(Appointment.client).joinedload(Client.company)
+    )
     if status:
         query = query.filter_by(status=sanitise_appointment_status(status))
     if from_arg:
@@ -582,18 +766,16 @@ def list_appointments():
     if to_arg:
         query = query.filter(Appointment.start_time <= parse_iso_datetime(to_arg, "to"))
 
-    appointments = query.order_by(Appointment.start_time.asc()).all()
+    appointments = paginate(query.order_by(Appointment.start_time.asc())).all()
     return jsonify([appointment.to_dict(include_client=True) for appointment in appointments])
 
 
 @crm_bp.route("/appointments/<int:appointment_id>", methods=["PUT"])
 def update_appointment(appointment_id: int):
-    appointment = Appointment.query.get_or_404(appointment_id)
+    appointment = db.get_or_404(Appointment, appointment_id)
     data = parse_json()
 
-    for field in ["title", "description", "assigned_to", "location", "notes"]:
-        if field in data:
-            setattr(appointment, field, data[field])
+    apply_updates(appointment, data, APPOINTMENT_UPDATE_FIELDS)
 
     if "status" in data:
         appointment.status = sanitise_appointment_status(data.get("status"))
@@ -619,7 +801,7 @@ def update_appointment(appointment_id: int):
 
 @crm_bp.route("/appointments/<int:appointment_id>", methods=["DELETE"])
 def delete_appointment(appointment_id: int):
-    appointment = Appointment.query.get_or_404(appointment_id)
+    appointment = db.get_or_404(Appointment, appointment_id)
     db.session.delete(appointment)
     db.session.commit()
     return "", 204
@@ -629,7 +811,7 @@ def delete_appointment(appointment_id: int):
 def client_remote_access(client_id: int):
     """Return remote access information for the client."""
 
-    client = Client.query.get_or_404(client_id)
+    client = db.get_or_404(Client, client_id)
     return jsonify(
         {
             "client_id": client.id,
@@ -643,7 +825,9 @@ def client_remote_access(client_id: int):
 def sync_client_remote_access(client_id: int):
     """Ensure AnyDesk is installed on the host and update the client's remote ID."""
 
-    client = Client.query.get_or_404(client_id)
+    from .remote import ensure_anydesk
+
+    client = db.get_or_404(Client, client_id)
     status = ensure_anydesk()
 
     if not status.installed:
@@ -682,13 +866,10 @@ def create_ticket():
     except (KeyError, ValueError) as exc:
         abort(400, description=f"Invalid client id: {exc}")
 
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     due_date = None
     if data.get("due_date"):
-        try:
-            due_date = datetime.fromisoformat(data["due_date"]).date()
-        except ValueError as exc:
-            abort(400, description=f"Invalid due date: {exc}")
+        due_date = parse_iso_date(data["due_date"], "due date")
 
     ticket = Ticket(
         client_id=client_id,
@@ -707,26 +888,23 @@ def create_ticket():
 @crm_bp.route("/tickets", methods=["GET"])
 def list_tickets():
     status = request.args.get("status")
-    query = Ticket.query
+    query = Ticket.query.options(selectinload(Ticket.monitoring_incident))
     if status:
         query = query.filter_by(status=status)
-    tickets = query.order_by(Ticket.priority.desc(), Ticket.created_at.desc()).all()
+    tickets = paginate(
+        query.order_by(Ticket.priority.desc(), Ticket.created_at.desc())
+    ).all()
     return jsonify([ticket.to_dict() for ticket in tickets])
 
 
 @crm_bp.route("/tickets/<int:ticket_id>", methods=["PUT"])
 def update_ticket(ticket_id: int):
-    ticket = Ticket.query.get_or_404(ticket_id)
+    ticket = db.get_or_404(Ticket, ticket_id)
     data = parse_json()
-    for field in ["subject", "description", "priority", "status", "assigned_to"]:
-        if field in data:
-            setattr(ticket, field, data[field])
+    apply_updates(ticket, data, TICKET_UPDATE_FIELDS)
     if "due_date" in data:
         if data["due_date"]:
-            try:
-                ticket.due_date = datetime.fromisoformat(data["due_date"]).date()
-            except ValueError as exc:
-                abort(400, description=f"Invalid due date: {exc}")
+            ticket.due_date = parse_iso_date(data["due_date"], "due date")
         else:
             ticket.due_date = None
     db.session.commit()
@@ -735,7 +913,7 @@ def update_ticket(ticket_id: int):
 
 @crm_bp.route("/tickets/<int:ticket_id>/notes", methods=["POST"])
 def create_ticket_note(ticket_id: int):
-    ticket = Ticket.query.get_or_404(ticket_id)
+    ticket = db.get_or_404(Ticket, ticket_id)
     data = parse_json()
     note = TicketNote(
         ticket_id=ticket.id,
@@ -747,48 +925,105 @@ def create_ticket_note(ticket_id: int):
     return jsonify(note.to_dict()), 201
 
 
+@crm_bp.route("/tickets/<int:ticket_id>/notes/bulk", methods=["POST"])
+def create_ticket_notes_bulk(ticket_id: int):
+    ticket = db.get_or_404(Ticket, ticket_id)
+    rows = parse_note_batch(parse_json(), "Technician")
+    notes = db.session.scalars(
+        insert(TicketNote).returning(TicketNote),
+        [{"ticket_id": ticket.id, **row} for row in rows],
+    ).all()
+    # Serialise before commit: committing expires the RETURNING rows, and
+    # reading them afterwards would reload every note with its own SELECT.
+    payload = [note.to_dict() for note in notes]
+    db.session.commit()
+    return jsonify(payload), 201
+
+
 @crm_bp.route("/dashboard/overview", methods=["GET"])
+@response_cache.cached(timeout=30)
 def dashboard_overview():
-    total_clients = Client.query.count()
-    open_tickets = Ticket.query.filter_by(status="open").count()
-    high_priority = Ticket.query.filter_by(priority="high", status="open").count()
-    active_contracts = ServiceContract.query.count()
-    open_tasks = Task.query.filter(Task.status != "completed").count()
-    upcoming_appointments = (
-        Appointment.query.filter(
-            Appointment.status == "scheduled", Appointment.start_time >= datetime.utcnow()
-        ).count()
-    )
-    open_incidents = MonitoringIncident.query.filter(
-        MonitoringIncident.status != "resolved"
-    ).count()
-    published_articles = KnowledgeBaseArticle.query.filter_by(is_published=True).count()
-
-    return jsonify(
-        {
-            "total_clients": total_clients,
-            "open_tickets": open_tickets,
-            "high_priority_tickets": high_priority,
-            "active_contracts": active_contracts,
-            "open_tasks": open_tasks,
-            "upcoming_appointments": upcoming_appointments,
-            "open_monitoring_incidents": open_incidents,
-            "published_knowledge_base_articles": published_articles,
-        }
-    )
+    counts = db.session.execute(
+        select(
+            count_rows(Client).label("total_clients"),
+            count_rows(Ticket, Ticket.status == "open").label("open_tickets"),
+            count_rows(
+                Ticket, Ticket.priority == "high", Ticket.status == "open"
+            ).label("high_priority_tickets"),
+            count_rows(ServiceContract).label("active_contracts"),
+            count_rows(Task, Task.status != "completed").label("open_tasks"),
+            count_rows(
+                Appointment,
+                Appointment.status == "scheduled",
+                Appointment.start_time >= datetime.utcnow(),
+            ).label("upcoming_appointments"),
+            count_rows(
+                MonitoringIncident, MonitoringIncident.status != "resolved"
+            ).label("open_monitoring_incidents"),
+            count_rows(
+                KnowledgeBaseArticle, KnowledgeBaseArticle.is_published.is_(True)
+            ).label("published_knowledge_base_articles"),
+        )
+    ).one()
+    return jsonify(dict(counts._mapping))
 
 
 @crm_bp.route("/analytics/forecasts", methods=["GET"])
+@response_cache.cached(timeout=60)
 def analytics_forecasts():
-    clients = Client.query.order_by(Client.name).all()
+    now = datetime.utcnow()
+    open_ticket = Ticket.status == "open"
+    open_task = Task.status != "completed"
+
+    ticket_counts = {
+        row.client_id: row
+        for row in db.session.query(
+            Ticket.client_id,
+            count_where(open_ticket).label("open"),
+            count_where(and_(open_ticket, Ticket.priority == "high")).label("high_priority"),
+        ).group_by(Ticket.client_id)
+    }
+    task_counts = {
+        row.client_id: row
+        for row in db.session.query(
+            Task.client_id,
+            count_where(open_task).label("open"),
+            count_where(and_(open_task, Task.due_date < now.date())).label("overdue"),
+        ).group_by(Task.client_id)
+    }
+    missed_appointments = dict(
+        db.session.query(Appointment.client_id, func.count())
+        .filter(Appointment.status == "cancelled")
+        .group_by(Appointment.client_id)
+        .all()
+    )
+    open_incidents = dict(
+        db.session.query(MonitoringIncident.client_id, func.count())
+        .filter(MonitoringIncident.status != "resolved")
+        .group_by(MonitoringIncident.client_id)
+        .all()
+    )
+
+    clients = (
+        Client.query.with_entities(Client.id, Client.name, Client.updated_at)
+        .order_by(Client.name)
+        .all()
+    )
     churn_predictions = []
     high_risk_clients = 0
 
     for client in clients:
-        tickets = list(client.tickets)
-        tasks = list(client.tasks)
-        appointments = list(client.appointments)
-        probability, label = calculate_churn_risk(client, tickets, tasks, appointments)
+        tickets = ticket_counts.get(client.id)
+        tasks = task_counts.get(client.id)
+        open_tickets = tickets.open if tickets else 0
+        high_priority = tickets.high_priority if tickets else 0
+        probability, label = calculate_churn_risk(
+            open_tickets,
+            high_priority,
+            tasks.overdue if tasks else 0,
+            missed_appointments.get(client.id, 0),
+            (now - client.updated_at).days,
+        )
         recommendation = "Maintain regular check-ins"
         if label == "high":
             high_risk_clients += 1
@@ -802,21 +1037,20 @@ def analytics_forecasts():
                 "client_name": client.name,
                 "churn_probability": round(probability, 2),
                 "churn_level": label,
-                "open_tickets": sum(1 for ticket in tickets if ticket.status == "open"),
-                "open_high_priority_tickets": sum(
-                    1
-                    for ticket in tickets
-                    if ticket.status == "open" and ticket.priority == "high"
-                ),
-                "open_tasks": sum(1 for task in tasks if task.status != "completed"),
-                "monitoring_incidents": sum(
-                    1 for incident in client.monitoring_incidents if incident.status != "resolved"
-                ),
+                "open_tickets": open_tickets,
+                "open_high_priority_tickets": high_priority,
+                "open_tasks": tasks.open if tasks else 0,
+                "monitoring_incidents": open_incidents.get(client.id, 0),
                 "recommendation": recommendation,
             }
         )
 
-    engineer_load = calculate_engineer_load(Task.query.all(), Appointment.query.all())
+    engineer_load = calculate_engineer_load(
+        db.session.query(Task.status, Task.assigned_to).all(),
+        db.session.query(
+            Appointment.status, Appointment.assigned_to, Appointment.duration_minutes
+        ).all(),
+    )
 
     return jsonify(
         {
@@ -825,7 +1059,7 @@ def analytics_forecasts():
             "summary": {
                 "total_clients": len(clients),
                 "high_risk_clients": high_risk_clients,
-                "generated_at": datetime.utcnow().isoformat(),
+                "generated_at": now.isoformat(),
             },
         }
     )
@@ -833,8 +1067,8 @@ def analytics_forecasts():
 
 @crm_bp.route("/companies", methods=["GET"])
 def list_companies():
-    companies = Company.query.order_by(Company.name).all()
-    return jsonify([company.to_dict() for company in companies])
+    companies = fetch_serialized(select_serialized(Company).order_by(Company.name))
+    return jsonify(companies)
 
 
 @crm_bp.route("/companies", methods=["POST"])
@@ -854,24 +1088,22 @@ def create_company():
 
 @crm_bp.route("/companies/<int:company_id>", methods=["GET"])
 def get_company(company_id: int):
-    company = Company.query.get_or_404(company_id)
+    company = db.get_or_404(Company, company_id)
     return jsonify(company.to_dict())
 
 
 @crm_bp.route("/companies/<int:company_id>", methods=["PUT"])
 def update_company(company_id: int):
-    company = Company.query.get_or_404(company_id)
+    company = db.get_or_404(Company, company_id)
     data = parse_json()
-    for field in ["name", "industry", "headquarters"]:
-        if field in data:
-            setattr(company, field, data[field])
+    apply_updates(company, data, COMPANY_UPDATE_FIELDS)
     db.session.commit()
     return jsonify(company.to_dict())
 
 
 @crm_bp.route("/companies/<int:company_id>", methods=["DELETE"])
 def delete_company(company_id: int):
-    company = Company.query.get_or_404(company_id)
+    company = db.get_or_404(Company, company_id)
     db.session.delete(company)
     db.session.commit()
     return "", 204
@@ -879,7 +1111,7 @@ def delete_company(company_id: int):
 
 @crm_bp.route("/knowledge-base", methods=["GET"])
 def list_knowledge_base_articles():
-    query = KnowledgeBaseArticle.query
+    query = select_serialized(KnowledgeBaseArticle)
     if request.args.get("published"):
         value = request.args["published"].lower() == "true"
         query = query.filter_by(is_published=value)
@@ -889,8 +1121,10 @@ def list_knowledge_base_articles():
         except (TypeError, ValueError):
             abort(400, description="Invalid client id filter")
         query = query.filter_by(client_id=client_id)
-    articles = query.order_by(KnowledgeBaseArticle.updated_at.desc()).all()
-    return jsonify([article.to_dict() for article in articles])
+    articles = fetch_serialized(
+        paginate(query.order_by(KnowledgeBaseArticle.updated_at.desc()))
+    )
+    return jsonify(articles)
 
 
 @crm_bp.route("/knowledge-base", methods=["POST"])
@@ -903,7 +1137,7 @@ def create_knowledge_base_article():
         summary=data.get("summary"),
         body=data["body"],
         category=data.get("category"),
-        tags=",".join(data.get("tags", [])) if isinstance(data.get("tags"), list) else data.get("tags"),
+        tags=data.get("tags"),
         author=data.get("author", "Knowledge Team"),
         is_published=bool(data.get("is_published", True)),
     )
@@ -912,7 +1146,7 @@ def create_knowledge_base_article():
             client_id = int(data["client_id"])
         except (TypeError, ValueError):
             abort(400, description="Invalid client id")
-        Client.query.get_or_404(client_id)
+        require_client_exists(client_id)
         article.client_id = client_id
     db.session.add(article)
     db.session.commit()
@@ -921,21 +1155,17 @@ def create_knowledge_base_article():
 
 @crm_bp.route("/knowledge-base/<int:article_id>", methods=["GET"])
 def get_knowledge_base_article(article_id: int):
-    article = KnowledgeBaseArticle.query.get_or_404(article_id)
+    article = db.get_or_404(KnowledgeBaseArticle, article_id)
     return jsonify(article.to_dict())
 
 
 @crm_bp.route("/knowledge-base/<int:article_id>", methods=["PUT"])
 def update_knowledge_base_article(article_id: int):
-    article = KnowledgeBaseArticle.query.get_or_404(article_id)
+    article = db.get_or_404(KnowledgeBaseArticle, article_id)
     data = parse_json()
-    for field in ["title", "summary", "body", "category", "author"]:
-        if field in data:
-            setattr(article, field, data[field])
+    apply_updates(article, data, ARTICLE_UPDATE_FIELDS)
     if "tags" in data:
-        article.tags = (
-            ",".join(data["tags"]) if isinstance(data["tags"], list) else data["tags"]
-        )
+        article.tags = data["tags"]
     if "is_published" in data:
         article.is_published = bool(data["is_published"])
     if "client_id" in data:
@@ -946,7 +1176,7 @@ def update_knowledge_base_article(article_id: int):
                 client_id = int(data["client_id"])
             except (TypeError, ValueError):
                 abort(400, description="Invalid client id")
-            Client.query.get_or_404(client_id)
+            require_client_exists(client_id)
             article.client_id = client_id
     db.session.commit()
     return jsonify(article.to_dict())
@@ -954,7 +1184,7 @@ def update_knowledge_base_article(article_id: int):
 
 @crm_bp.route("/knowledge-base/<int:article_id>", methods=["DELETE"])
 def delete_knowledge_base_article(article_id: int):
-    article = KnowledgeBaseArticle.query.get_or_404(article_id)
+    article = db.get_or_404(KnowledgeBaseArticle, article_id)
     db.session.delete(article)
     db.session.commit()
     return "", 204
@@ -962,7 +1192,7 @@ def delete_knowledge_base_article(article_id: int):
 
 @crm_bp.route("/clients/<int:client_id>/tasks", methods=["GET"])
 def list_client_tasks(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     tasks = (
         Task.query.filter_by(client_id=client_id)
         .order_by(Task.due_date, Task.priority.desc(), Task.created_at.desc())
@@ -973,16 +1203,13 @@ def list_client_tasks(client_id: int):
 
 @crm_bp.route("/clients/<int:client_id>/tasks", methods=["POST"])
 def create_client_task(client_id: int):
-    Client.query.get_or_404(client_id)
+    require_client_exists(client_id)
     data = parse_json()
     if "title" not in data:
         abort(400, description="Task title is required")
     due_date = None
     if data.get("due_date"):
-        try:
-            due_date = datetime.fromisoformat(data["due_date"]).date()
-        except ValueError as exc:
-            abort(400, description=f"Invalid task due date: {exc}")
+        due_date = parse_iso_date(data["due_date"], "task due date")
     task = Task(
         client_id=client_id,
         title=data["title"],
@@ -999,28 +1226,24 @@ def create_client_task(client_id: int):
 
 
 @crm_bp.route("/tasks", methods=["GET"])
+@response_cache.cached(timeout=30, query_args=("status", "limit", "offset"))
 def list_tasks():
     status = request.args.get("status")
-    query = Task.query
+    query = select_serialized(Task)
     if status:
         query = query.filter_by(status=status)
-    tasks = query.order_by(Task.due_date, Task.created_at.desc()).all()
-    return jsonify([task.to_dict() for task in tasks])
+    tasks = fetch_serialized(paginate(query.order_by(Task.due_date, Task.created_at.desc())))
+    return jsonify(tasks)
 
 
 @crm_bp.route("/tasks/<int:task_id>", methods=["PUT"])
 def update_task(task_id: int):
-    task = Task.query.get_or_404(task_id)
+    task = db.get_or_404(Task, task_id)
     data = parse_json()
-    for field in ["title", "description", "status", "priority", "assigned_to", "created_by"]:
-        if field in data:
-            setattr(task, field, data[field])
+    apply_updates(task, data, TASK_UPDATE_FIELDS)
     if "due_date" in data:
         if data["due_date"]:
-            try:
-                task.due_date = datetime.fromisoformat(data["due_date"]).date()
-            except ValueError as exc:
-                abort(400, description=f"Invalid task due date: {exc}")
+            task.due_date = parse_iso_date(data["due_date"], "task due date")
         else:
             task.due_date = None
     if "client_id" in data:
@@ -1031,7 +1254,7 @@ def update_task(task_id: int):
                 new_client_id = int(data["client_id"])
             except (TypeError, ValueError):
                 abort(400, description="Invalid client id")
-            Client.query.get_or_404(new_client_id)
+            require_client_exists(new_client_id)
             task.client_id = new_client_id
     db.session.commit()
     return jsonify(task.to_dict())
@@ -1039,7 +1262,7 @@ def update_task(task_id: int):
 
 @crm_bp.route("/tasks/<int:task_id>/complete", methods=["POST"])
 def complete_task(task_id: int):
-    task = Task.query.get_or_404(task_id)
+    task = db.get_or_404(Task, task_id)
     task.status = "completed"
     task.completed_at = datetime.utcnow()
     db.session.commit()
@@ -1052,12 +1275,10 @@ def optimise_schedule():
     if "date" not in data:
         abort(400, description="A target date is required")
 
-    try:
-        target_date = datetime.fromisoformat(data["date"]).date()
-    except ValueError as exc:
-        abort(400, description=f"Invalid date: {exc}")
+    target_date = parse_iso_date(data["date"], "date")
 
     travel_buffer = int(data.get("travel_buffer_minutes", 30))
+    travel_delta = timedelta(minutes=travel_buffer)
     workday_minutes = int(data.get("workday_minutes", 8 * 60))
     engineers_input = data.get("engineers") or []
 
@@ -1065,36 +1286,58 @@ def optimise_schedule():
     day_end = day_start + timedelta(minutes=workday_minutes)
 
     engineer_slots: Dict[str, datetime] = {}
+    engineer_rank: Dict[str, int] = {}
+    # (free from, first-seen rank, engineer); entries go stale when the
+    # engineer is booked again and are dropped lazily when they surface.
+    free_engineers: list[Tuple[datetime, int, str]] = []
+
+    def book_engineer(engineer: str, free_from: datetime) -> None:
+        rank = engineer_rank.setdefault(engineer, len(engineer_rank))
+        engineer_slots[engineer] = free_from
+        heapq.heappush(free_engineers, (free_from, rank, engineer))
+
     for engineer in engineers_input:
-        engineer_slots[str(engineer)] = day_start
+        book_engineer(str(engineer), day_start)
 
     start_window = datetime.combine(target_date, time.min)
     end_window = datetime.combine(target_date, time.max)
 
-    appointments = (
-        Appointment.query.filter(
+    # Only the columns the optimiser reads; ix_appt_status_start covers them
+    # on PostgreSQL, so the appointments side is an index-only scan.
+    appointments = db.session.execute(
+        select(
+            Appointment.id,
+            Appointment.start_time,
+            Appointment.duration_minutes,
+            Appointment.assigned_to,
+            Client.name.label("client_name"),
+        )
+        .outerjoin(Client, Appointment.client_id == Client.id)
+        .where(
             Appointment.status == "scheduled",
             Appointment.start_time >= start_window,
             Appointment.start_time <= end_window,
         )
         .order_by(Appointment.start_time.asc())
-        .all()
-    )
+    ).all()
 
     suggestions = []
     reassigned = 0
+    durations: Dict[int, timedelta] = {}
 
     for appointment in appointments:
         engineer = appointment.assigned_to or None
         if engineer and engineer not in engineer_slots:
-            engineer_slots[engineer] = day_start
+            book_engineer(engineer, day_start)
 
         if not engineer:
             if engineer_slots:
-                engineer = min(engineer_slots, key=engineer_slots.get)
+                while free_engineers[0][0] != engineer_slots[free_engineers[0][2]]:
+                    heapq.heappop(free_engineers)
+                engineer = free_engineers[0][2]
             else:
                 engineer = "Unassigned"
-                engineer_slots[engineer] = day_start
+                book_engineer(engineer, day_start)
             reassigned += 1
 
         suggested_start = max(appointment.start_time, engineer_slots[engineer])
@@ -1102,21 +1345,27 @@ def optimise_schedule():
         if suggested_start > appointment.start_time:
             reason = "Resolved overlap with preceding visit"
 
-        suggested_end = suggested_start + timedelta(minutes=appointment.duration_minutes)
-        if suggested_end + timedelta(minutes=travel_buffer) > day_end:
+        duration = durations.get(appointment.duration_minutes)
+        if duration is None:
+            duration = durations[appointment.duration_minutes] = timedelta(
+                minutes=appointment.duration_minutes
+            )
+        suggested_end = suggested_start + duration
+        free_from = suggested_end + travel_delta
+        if free_from > day_end:
             reason = "Extends beyond workday; consider another engineer"
 
-        engineer_slots[engineer] = suggested_end + timedelta(minutes=travel_buffer)
+        book_engineer(engineer, free_from)
 
         suggestions.append(
             {
                 "appointment_id": appointment.id,
-                "client": appointment.client.name if appointment.client else None,
+                "client": appointment.client_name,
                 "assigned_engineer": appointment.assigned_to,
                 "recommended_engineer": engineer,
-                "current_start": appointment.start_time.isoformat(),
-                "optimized_start": suggested_start.isoformat(),
-                "optimized_end": suggested_end.isoformat(),
+                "current_start": appointment.start_time,
+                "optimized_start": suggested_start,
+                "optimized_end": suggested_end,
                 "travel_buffer_minutes": travel_buffer,
                 "notes": reason,
             }
@@ -1124,18 +1373,18 @@ def optimise_schedule():
 
     return jsonify(
         {
-            "date": target_date.isoformat(),
+            "date": target_date,
             "appointments_considered": len(appointments),
             "reassignments": reassigned,
             "suggestions": suggestions,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": datetime.utcnow(),
         }
     )
 
 
 @crm_bp.route("/clients/<int:client_id>/theme", methods=["PUT"])
 def update_client_theme(client_id: int):
-    client = Client.query.get_or_404(client_id)
+    client = db.get_or_404(Client, client_id)
     data = parse_json()
     client.theme_preference = sanitise_theme(data.get("theme"))
     db.session.commit()
@@ -1157,9 +1406,14 @@ def register_user():
     for field in ["username", "email", "password"]:
         if field not in data:
             abort(400, description="Missing required user field")
-    if User.query.filter_by(username=data["username"]).first():
+    taken = (
+        User.query.with_entities(User.username, User.email)
+        .filter(or_(User.username == data["username"], User.email == data["email"]))
+        .all()
+    )
+    if any(row.username == data["username"] for row in taken):
         abort(409, description="Username already exists")
-    if User.query.filter_by(email=data["email"]).first():
+    if taken:
         abort(409, description="Email already registered")
     user = User(
         username=data["username"],
@@ -9,6 +9,7 @@ from __future__ import annotations
 import argparse
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -26,10 +27,18 @@ DEFAULT_NAME = "crm"
 
 
 def clean_previous_build_artifacts() -> None:
-    """Remove PyInstaller build directories if they exist."""
-    for folder in (PROJECT_ROOT / "build", PROJECT_ROOT / "dist"):
-        if folder.exists():
-            shutil.rmtree(folder)
+    """Remove PyInstaller build directories if they exist.
+
+    The folders are independent, so they are deleted concurrently; ``build/``
+    holds thousands of small files and dominates the time on Windows.
+    """
+    folders = [
+        folder
+        for folder in (PROJECT_ROOT / "build", PROJECT_ROOT / "dist")
+        if folder.exists()
+    ]
+    with ThreadPoolExecutor(max_workers=len(folders) or 1) as executor:
+        list(executor.map(shutil.rmtree, folders))
 
 
 def run_pyinstaller(name: str, extra_args: list[str] | None = None) -> None: